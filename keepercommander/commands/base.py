@@ -670,9 +670,10 @@ class RecordMixin:
 
         folder_uid = folder.uid or ''
         if folder_uid in params.subfolder_record_cache:
+            record_name_cf = record_name.casefold()
             for uid in params.subfolder_record_cache[folder_uid]:
                 record = vault.KeeperRecord.load(params, uid)
-                if record and record.title.casefold() == record_name.casefold():
+                if record and record.title.casefold() == record_name_cf:
                     return record
 
     @staticmethod
@@ -247,10 +247,11 @@ class ConnectSshCommand(BaseConnectCommand):
                 if folder is not None and record_name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        record_name_lc = record_name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = KeeperRecord.load(params, uid)
                             if r:
-                                if r.title.lower() == record_name.lower():
+                                if r.title.lower() == record_name_lc:
                                     record = r
                                     break
 
@@ -594,10 +595,11 @@ class ConnectCommand(BaseConnectCommand):
                         if folder is not None and title is not None:
                             folder_uid = folder.uid or ''
                             if folder_uid in params.subfolder_record_cache:
+                                title_lc = title.lower()
                                 for uid in params.subfolder_record_cache[folder_uid]:
                                     r = KeeperRecord.load(params, uid)
                                     if r:
-                                        if r.title.lower() == title.lower():
+                                        if r.title.lower() == title_lc:
                                             record_uid = uid
                                             break
                 if record_uid:
@@ -15,11 +15,12 @@ def get_record_uids(params, name):  # type: (KeeperParams, str) -> Set[Optional[
         # if rs is not None:
         folders, name = rs
         if folders and name is not None:
+            name_lc = name.lower()
             for folder in folders:
                 folder_uid = folder.uid or ''
                 if folder_uid in params.subfolder_record_cache:
                     for r_uid in params.subfolder_record_cache[folder_uid]:
                         r = api.get_record(params, r_uid)
-                        if r.title.lower() == name.lower():
+                        if r.title.lower() == name_lc:
                             uids.add(r_uid)
     return uids
@@ -192,9 +192,10 @@ def find_record(params, record_name, types=None):
             if folder is not None and record_name is not None:
                 folder_uid = folder.uid or ''
                 if folder_uid in params.subfolder_record_cache:
+                    record_name_lc = record_name.lower()
                     for uid in params.subfolder_record_cache[folder_uid]:
                         r = vault.KeeperRecord.load(params, uid)
-                        if r and r.title.lower() == record_name.lower():
+                        if r and r.title.lower() == record_name_lc:
                             return r
 
     if types:
@@ -1463,9 +1464,10 @@ class RecordHistoryCommand(Command, RecordMixin):
                 if folder is not None and record_name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        record_name_lc = record_name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = api.get_record(params, uid)
-                            if r.title.lower() == record_name.lower():
+                            if r.title.lower() == record_name_lc:
                                 record_uid = uid
                                 break
 
@@ -1785,11 +1787,12 @@ class ClipboardCommand(Command, RecordMixin):
                 if folder is not None and record_name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        record_name_lc = record_name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = vault.KeeperRecord.load(params, uid)
                             if not isinstance(r, (vault.PasswordRecord, vault.TypedRecord)):
                                 continue
-                            if r.title.lower() == record_name.lower():
+                            if r.title.lower() == record_name_lc:
                                 if user_pattern:
                                     login = ''
                                     if isinstance(r, vault.PasswordRecord):
@@ -2000,6 +2003,7 @@ class RecordRemoveCommand(Command):
                                 folders = [folders]
                             else:
                                 folders = [params.root_folder]
+                        record_name_cf = record_name.casefold()
                         for folder in folders:
                             if not isinstance(folder, BaseFolderNode):
                                 continue
@@ -2012,7 +2016,7 @@ class RecordRemoveCommand(Command):
                                 else:
                                     record = vault.KeeperRecord.load(params, record_uid)
                                     if record:
-                                        if record.title.casefold() == record_name.casefold():
+                                        if record.title.casefold() == record_name_cf:
                                             records_to_delete.append((folder, record_uid))
                 if len(records_to_delete) == orig_len:
                     raise CommandError('rm', f'Record {name} cannot be resolved')
@@ -925,9 +925,10 @@ class RecordDeleteAttachmentCommand(Command):
                 if folder is not None and record_name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        record_name_lc = record_name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = api.get_record(params, uid)
-                            if r.title.lower() == record_name.lower():
+                            if r.title.lower() == record_name_lc:
                                 record_uid = uid
                                 break
 
@@ -1008,10 +1009,11 @@ class RecordDownloadAttachmentCommand(Command):
                         if name:
                             f_uid = fol.uid or ''
                             if f_uid in params.subfolder_record_cache:
+                                name_lc = name.lower()
                                 for uid in params.subfolder_record_cache[f_uid]:
                                     r = vault.KeeperRecord.load(params, uid)
                                     if isinstance(r, (vault.PasswordRecord, vault.TypedRecord)):
-                                        if r.title.lower() == name.lower():
+                                        if r.title.lower() == name_lc:
                                             record_uids.add(r.record_uid)
                         else:
                             folder = fol
@@ -1101,9 +1103,10 @@ class RecordUploadAttachmentCommand(Command):
                 if folder is not None and record_name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        record_name_lc = record_name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = api.get_record(params, uid)
-                            if r.title.lower() == record_name.lower():
+                            if r.title.lower() == record_name_lc:
                                 record_uid = uid
                                 break
 
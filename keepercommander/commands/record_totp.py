@@ -60,9 +60,10 @@ class TotpCommand(Command):
                     if folder is not None and record_name is not None:
                         folder_uid = folder.uid or ''
                         if folder_uid in params.subfolder_record_cache:
+                            record_name_lc = record_name.lower()
                             for uid in params.subfolder_record_cache[folder_uid]:
                                 r = api.get_record(params, uid)
-                                if r.title.lower() == record_name.lower():
+                                if r.title.lower() == record_name_lc:
                                     record_uid = uid
                                     break
 
@@ -238,9 +238,10 @@ class RecordEditCommand(Command, RecordUtils):
                 if folder is not None and name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        name_lc = name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = api.get_record(params, uid)
-                            if r.title.lower() == name.lower():
+                            if r.title.lower() == name_lc:
                                 record_uid = uid
                                 break
 
@@ -744,9 +744,10 @@ class ShareRecordCommand(Command):
                 if rs is not None:
                     folder, name = rs
                     if name:
+                        name_lc = name.lower()
                         for uid in params.subfolder_record_cache.get(folder.uid or ''):
                             r = api.get_record(params, uid)
-                            if r.title.lower() == name.lower():
+                            if r.title.lower() == name_lc:
                                 record_uid = uid
                                 break
                     else:
@@ -2161,9 +2162,10 @@ class OneTimeShareCommand(GroupCommand):
                 if folder is not None and name is not None:
                     folder_uid = folder.uid or ''
                     if folder_uid in params.subfolder_record_cache:
+                        name_lc = name.lower()
                         for uid in params.subfolder_record_cache[folder_uid]:
                             r = api.get_record(params, uid)
-                            if r.title.lower() == name.lower():
+                            if r.title.lower() == name_lc:
                                 record_uid = uid
                                 break
 
@@ -2270,11 +2272,12 @@ class OneTimeShareListCommand(Command):
                     if r_name:
                         f_uid = folder.uid or ''
                         if f_uid in params.subfolder_record_cache:
+                            r_name_lc = r_name.lower()
                             for uid in params.subfolder_record_cache[f_uid]:
                                 rec = vault.KeeperRecord.load(params, uid)
                                 if rec.version not in (2, 3):
                                     continue
-                                if rec.title.lower() == r_name.lower():
+                                if rec.title.lower() == r_name_lc:
                                     record_uid = uid
                                     break
                     else:
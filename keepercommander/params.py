@@ -41,6 +41,7 @@ class RestApiContext:
         self.proxies = None
         self._certificate_check = True
         self.fail_on_throttle = False
+        self.http_session = None
 
     def __get_server_base(self):
         return self.__server_base
@@ -70,6 +71,11 @@ class RestApiContext:
         else:
             self.proxies = None
 
+    def close_http_session(self):
+        if self.http_session:
+            self.http_session.close()
+            self.http_session = None
+
     @property
     def certificate_check(self):
         return self._certificate_check
@@ -221,6 +227,8 @@ class KeeperParams:
         self.account_uid_bytes = None
         self.session_token_bytes = None
         self.record_type_cache = {}
+        if self.breach_watch and self.breach_watch.rest_api:
+            self.breach_watch.rest_api.close_http_session()
         self.breach_watch = None
         self.breach_watch_records = {}
         self.breach_watch_security_data = {}
@@ -233,6 +241,7 @@ class KeeperParams:
         self.tunnel_threads.clear()
         self.tunnel_threads_queue = {}
         self.forbid_rsa = False
+        self.__rest_context.close_http_session()
 
     def __get_rest_context(self):   # type: () -> RestApiContext
         return self.__rest_context
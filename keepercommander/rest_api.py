@@ -145,9 +145,13 @@ def execute_rest(context, endpoint, payload):
         else:
             url = context.server_base + endpoint
 
+        if context.http_session is None:
+            # keep-alive: reuse the TCP/TLS connection across API calls
+            context.http_session = requests.Session()
+
         try:
-            rs = requests.post(url, data=request_data, headers={'Content-Type': 'application/octet-stream'},
-                               proxies=context.proxies, verify=context.certificate_check)
+            rs = context.http_session.post(url, data=request_data, headers={'Content-Type': 'application/octet-stream'},
+                                           proxies=context.proxies, verify=context.certificate_check)
         except requests.exceptions.SSLError as e:
             doc_url = 'https://docs.keeper.io/secrets-manager/commander-cli/using-commander/troubleshooting-commander-cli#ssl-certificate-errors'
             if len(e.args) > 0:
@@ -0,0 +1,78 @@
+from unittest import TestCase, mock
+
+from keepercommander import rest_api
+from keepercommander.breachwatch import BreachWatch
+from keepercommander.params import KeeperParams, RestApiContext
+from keepercommander.proto import APIRequest_pb2 as proto
+
+
+class TestExecuteRest(TestCase):
+    def setUp(self):
+        self.session_mock = mock.patch('keepercommander.rest_api.requests.Session').start()
+
+    def tearDown(self):
+        mock.patch.stopall()
+
+    @staticmethod
+    def make_response(status_code, content_type='', json_body=None):
+        rs = mock.Mock()
+        rs.status_code = status_code
+        rs.headers = {'Content-Type': content_type}
+        rs.content = b''
+        rs.json.return_value = json_body
+        return rs
+
+    def test_session_reused(self):
+        context = RestApiContext(server='keepersecurity.com')
+        context.set_proxy('http://proxy.local:3128')
+        context.certificate_check = False
+        self.addCleanup(setattr, context, 'certificate_check', True)
+        post = self.session_mock.return_value.post
+        post.return_value = self.make_response(200)
+
+        rest_api.execute_rest(context, 'vault/sync_down', proto.ApiRequestPayload())
+        rest_api.execute_rest(context, 'vault/sync_down', proto.ApiRequestPayload())
+
+        self.session_mock.assert_called_once()
+        self.assertIs(context.http_session, self.session_mock.return_value)
+        self.assertEqual(post.call_count, 2)
+        for call in post.call_args_list:
+            _, kwargs = call
+            self.assertEqual(kwargs['proxies'], context.proxies)
+            self.assertFalse(kwargs['verify'])
+
+    def test_server_key_retry(self):
+        context = RestApiContext(server='keepersecurity.com')
+        post = self.session_mock.return_value.post
+        post.side_effect = [
+            self.make_response(401, 'application/json', {'error': 'key', 'key_id': 8}),
+            self.make_response(200),
+        ]
+
+        rest_api.execute_rest(context, 'vault/sync_down', proto.ApiRequestPayload())
+
+        self.session_mock.assert_called_once()
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(context.server_key_id, 8)
+
+    def test_clear_session_closes_http_session(self):
+        params = KeeperParams()
+        http_session = mock.Mock()
+        params.rest_context.http_session = http_session
+
+        params.clear_session()
+
+        http_session.close.assert_called_once()
+        self.assertIsNone(params.rest_context.http_session)
+
+    def test_clear_session_closes_breachwatch_http_session(self):
+        params = KeeperParams()
+        params.breach_watch = BreachWatch()
+        params.breach_watch.rest_api = RestApiContext(server='keepersecurity.com')
+        http_session = mock.Mock()
+        params.breach_watch.rest_api.http_session = http_session
+
+        params.clear_session()
+
+        http_session.close.assert_called_once()
+        self.assertIsNone(params.breach_watch)